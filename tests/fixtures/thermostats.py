@@ -8,6 +8,7 @@ import numpy as np
 from numpy import nan
 
 import pytest
+from functools import lru_cache
 
 # will be modified, recreate every time by scoping to function
 @pytest.fixture(scope='function')
@@ -47,49 +48,38 @@ def thermostat_template():
 # travis.)
 # To speed this up, spoof the weather source.
 
-@pytest.fixture(scope="session", params=["../data/metadata_type_1_single_utc_offset_0.csv"])
-def thermostat_type_1_utc(request):
-    thermostats = from_csv(get_data_path(request.param))
+# These fixtures are imported into several test modules, each of which gets its
+# own copy of the session fixture, so load each CSV file only once.
+@lru_cache(maxsize=None)
+def _load_thermostat(path):
+    thermostats = from_csv(get_data_path(path))
     return next(thermostats)
 
+def _single_thermostat_fixture(path):
+    """ Builds a session fixture that loads the single thermostat described by
+    the metadata file at `path` through the shared loader. """
+    @pytest.fixture(scope="session", params=[path])
+    def _fixture(request):
+        return _load_thermostat(request.param)
+    return _fixture
+
+thermostat_type_1_utc = _single_thermostat_fixture("../data/metadata_type_1_single_utc_offset_0.csv")
+
 @pytest.fixture(scope="session", params=["../data/metadata_type_1_single_utc_offset_bad.csv"])
 def thermostat_type_1_utc_bad(request):
-    thermostats = from_csv(get_data_path(request.param))
+    return next(from_csv(get_data_path(request.param)), None)
 
 @pytest.fixture(scope="session", params=["../data/metadata_multiple_same_key.csv"])
 def thermostats_multiple_same_key(request):
     thermostats = from_csv(get_data_path(request.param))
     return thermostats
 
-@pytest.fixture(scope="session", params=["../data/metadata_type_1_single.csv"])
-def thermostat_type_1(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
-
-@pytest.fixture(scope="session", params=["../data/metadata_type_2_single.csv"])
-def thermostat_type_2(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
-
-@pytest.fixture(scope="session", params=["../data/metadata_type_3_single.csv"])
-def thermostat_type_3(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
-
-@pytest.fixture(scope="session", params=["../data/metadata_type_4_single.csv"])
-def thermostat_type_4(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
-
-@pytest.fixture(scope="session", params=["../data/metadata_type_5_single.csv"])
-def thermostat_type_5(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
-
-@pytest.fixture(scope="session", params=["../data/metadata_single_zero_days.csv"])
-def thermostat_zero_days(request):
-    thermostats = from_csv(get_data_path(request.param))
-    return next(thermostats)
+thermostat_type_1 = _single_thermostat_fixture("../data/metadata_type_1_single.csv")
+thermostat_type_2 = _single_thermostat_fixture("../data/metadata_type_2_single.csv")
+thermostat_type_3 = _single_thermostat_fixture("../data/metadata_type_3_single.csv")
+thermostat_type_4 = _single_thermostat_fixture("../data/metadata_type_4_single.csv")
+thermostat_type_5 = _single_thermostat_fixture("../data/metadata_type_5_single.csv")
+thermostat_zero_days = _single_thermostat_fixture("../data/metadata_single_zero_days.csv")
 
 @pytest.fixture(scope="session", params=["../data/metadata_single_emg_aux_constant_on_outlier.csv"])
 def thermostat_emg_aux_constant_on_outlier(request):
@@ -1,7 +1,13 @@
+from thermostat import importers
 from thermostat.importers import from_csv
 from thermostat.importers import normalize_utc_offset
+from thermostat.importers import save_json_cache
 from thermostat.util.testing import get_data_path
+from eeweather.cache import KeyValueStore
 import datetime
+import json
+import multiprocessing
+import time
 
 import pandas as pd
 
@@ -30,6 +36,54 @@ def test_import_csv(thermostat_type_1):
     assert_is_series_with_shape(thermostat_type_1.temperature_in, (35064,))
     assert_is_series_with_shape(thermostat_type_1.temperature_out, (35064,))
 
+def test_import_csv_close_early(monkeypatch):
+    # Keep a reference to the worker pipeline, so that it isn't shut down
+    # by being garbage collected
+    pipelines = []
+    import_thermostats_pipelined = importers._import_thermostats_pipelined
+
+    def keep_pipeline(*args, **kwargs):
+        pipelines.append(import_thermostats_pipelined(*args, **kwargs))
+        return pipelines[-1]
+
+    monkeypatch.setattr(importers, "_import_thermostats_pipelined", keep_pipeline)
+
+    thermostats = from_csv(get_data_path("data/metadata.csv"))
+    assert next(thermostats).thermostat_id is not None
+
+    # Abandoning the import stops the worker pools
+    thermostats.close()
+    assert multiprocessing.active_children() == []
+
+def test_import_csv_bounded_in_flight(monkeypatch):
+    rows_started = []
+    iter_metadata_rows = importers._iter_metadata_rows
+
+    def counting_iter_metadata_rows(metadata):
+        for metadata_row in iter_metadata_rows(metadata):
+            rows_started.append(metadata_row)
+            yield metadata_row
+
+    def slow_indexed_temperatures(station, index):
+        time.sleep(0.2)
+        return pd.Series(50.0, index=index)
+
+    monkeypatch.setattr(importers, "MAX_THERMOSTATS_IN_FLIGHT", 2)
+    monkeypatch.setattr(importers, "_iter_metadata_rows", counting_iter_metadata_rows)
+    monkeypatch.setattr(importers, "_get_closest_station_by_zipcode", lambda zipcode: "725300")
+    monkeypatch.setattr(importers, "get_indexed_temperatures_eeweather", slow_indexed_temperatures)
+
+    thermostats_loaded = 0
+    max_in_flight = 0
+    for thermostat in from_csv(get_data_path("data/metadata.csv")):
+        thermostats_loaded += 1
+        max_in_flight = max(max_in_flight, len(rows_started) - thermostats_loaded)
+
+    # Skipped rows also count as in flight until they are skipped
+    rows_skipped = len(rows_started) - thermostats_loaded
+    assert thermostats_loaded > 0
+    assert max_in_flight <= 2 + rows_skipped
+
 def test_utc_offset(thermostat_type_1_utc, thermostat_type_1_utc_bad):
     assert(normalize_utc_offset("+0") == datetime.timedelta(0))
     assert(normalize_utc_offset("-0") == datetime.timedelta(0))
@@ -46,3 +100,37 @@ def test_utc_offset(thermostat_type_1_utc, thermostat_type_1_utc_bad):
     # Load a thermostat with utc offset == 0
     assert(isinstance(thermostat_type_1_utc.cool_runtime, pd.Series))
     assert(thermostat_type_1_utc_bad is None)
+
+def test_save_json_cache(tmpdir, monkeypatch):
+    store = KeyValueStore(url="sqlite:///{}".format(tmpdir.join("cache.db")))
+    store.save_json("ISD-725300-2013.json", {"2013-01-01T00:00:00": 1.5})
+    store.save_json("ISD-999999-2012.json", {"2012-01-01T00:00:00": 2.5})
+    monkeypatch.setattr(importers, "KeyValueStore", lambda: store)
+
+    index = pd.date_range("2012-12-31", periods=48, freq="H")
+    save_json_cache(index, "thermostat_1", "725300", str(tmpdir))
+
+    with open(str(tmpdir.join("thermostat_1.json"))) as f:
+        json_cache = json.load(f)
+    assert list(json_cache) == ["ISD-725300-2012.json", "ISD-725300-2013.json"]
+    assert json_cache["ISD-725300-2012.json"] is None
+    assert json_cache["ISD-725300-2013.json"] == {"2013-01-01T00:00:00": 1.5}
+
+def test_save_json_cache_without_engine(tmpdir, monkeypatch):
+    # Stores that don't expose their engine are read one key at a time
+    class JSONStore(object):
+        def retrieve_json(self, key):
+            if key == "ISD-725300-2013.json":
+                return {"2013-01-01T00:00:00": 1.5}
+            return None
+    monkeypatch.setattr(importers, "KeyValueStore", JSONStore)
+
+    index = pd.date_range("2012-12-31", periods=48, freq="H")
+    save_json_cache(index, "thermostat_1", "725300", str(tmpdir))
+
+    with open(str(tmpdir.join("thermostat_1.json"))) as f:
+        json_cache = json.load(f)
+    assert json_cache == {
+        "ISD-725300-2012.json": None,
+        "ISD-725300-2013.json": {"2013-01-01T00:00:00": 1.5},
+    }
@@ -242,6 +242,8 @@ def metrics_to_csv(metrics, filepath):
         DataFrame containing data output to CSV.
     """
 
+    # The DataFrame is already built with exactly COLUMNS in order, so there
+    # is no need for to_csv to select them again (which copies the frame).
     output_dataframe = pd.DataFrame(metrics, columns=COLUMNS)
-    output_dataframe.to_csv(filepath, index=False, columns=COLUMNS)
+    output_dataframe.to_csv(filepath, index=False)
     return output_dataframe
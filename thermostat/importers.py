@@ -1,6 +1,7 @@
 from thermostat.core import Thermostat
 
 import pandas as pd
+import numpy as np
 from thermostat.stations import get_closest_station_by_zipcode
 
 from thermostat.eeweather_wrapper import get_indexed_temperatures_eeweather
@@ -9,34 +10,108 @@ from eeweather.exceptions import ISDDataNotAvailableError
 import json
 
 import warnings
-import dateutil.parser
+import datetime
+import re
 import os
 import errno
-import pytz
+import inspect
+import threading
 from multiprocessing import Pool, cpu_count
-from functools import partial
+from functools import partial, lru_cache
+from collections import namedtuple
 import logging
 
+try:
+    import pyarrow
+    from pyarrow import csv as pyarrow_csv
+    PYARROW_TYPES = {str: pyarrow.string(), int: pyarrow.int64()}
+except ImportError:
+    pyarrow_csv = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     NUMBER_OF_CORES = len(os.sched_getaffinity(0))
 except AttributeError:
     NUMBER_OF_CORES = cpu_count()
 MAX_FTP_CONNECTIONS = 3
+# Processes used to download weather data (one FTP connection each).
 AVAILABLE_PROCESSES = min(NUMBER_OF_CORES, MAX_FTP_CONNECTIONS)
+# Thermostats the multiprocess import may have loaded ahead of the caller.
+MAX_THERMOSTATS_IN_FLIGHT = AVAILABLE_PROCESSES * 4
+
+# Hourly interval data is stored as 24 columns per day, e.g. temp_in_00 through
+# temp_in_23. The names are built once here as (immutable) pandas Indexes.
+HOURLY_COLUMN_PREFIXES = (
+    "temp_in",
+    "heating_setpoint",
+    "cooling_setpoint",
+    "auxiliary_heat_runtime",
+    "emergency_heat_runtime",
+)
+HOURLY_COLUMNS = {
+    prefix: pd.Index(["{}_{:02d}".format(prefix, i) for i in range(24)])
+    for prefix in HOURLY_COLUMN_PREFIXES
+}
+
+# (heating, cooling, aux_emerg) for each supported equipment type.
+EQUIPMENT_TYPES = {
+    1: (True, True, True),
+    2: (True, True, False),
+    3: (True, True, False),
+    4: (True, False, False),
+    5: (False, True, False),
+    }
+SUPPORTED_EQUIPMENT_TYPES = frozenset(EQUIPMENT_TYPES)
+
+# Interval data dates are documented as ISO-8601 (YYYY-MM-DD).
+DATE_FORMAT = "%Y-%m-%d"
+
+# Write buffer for the per-thermostat JSON weather cache files (1 MiB).
+JSON_CACHE_BUFFER_SIZE = 1 << 20
+
+# UTC offsets are given as hours ("-7", "+10") or hours and minutes ("-0700").
+UTC_OFFSET_PATTERN = re.compile(r"^([+-])(?:(\d{1,2})|(\d{2})(\d{2}))$")
+
+# One row of the metadata file. Rows are sent to the worker processes as
+# these (picklable) tuples rather than as pandas Series.
+ThermostatMetadata = namedtuple("ThermostatMetadata", [
+    "thermostat_id",
+    "equipment_type",
+    "zipcode",
+    "utc_offset",
+    "interval_data_filename",
+])
 
 
 logger = logging.getLogger(__name__)
 
+_eeweather_cache_primed = False
+
+# Many thermostats share a ZIP code, so remember station lookups within each
+# process.
+_get_closest_station_by_zipcode = lru_cache(maxsize=None)(get_closest_station_by_zipcode)
+
 
 def __prime_eeweather_cache():
     """ Primes the eemeter / eeweather caches by doing a non-existent query
     This creates the cache directories sooner than if they were created
     during normal processing (which can lead to a race condition and missing
     thermostats)
+
+    The caches only need to be primed once per process.
     """
+    global _eeweather_cache_primed
+    if _eeweather_cache_primed:
+        return
+
     sql_json = KeyValueStore()
     if sql_json.key_exists('0') is not False:
         raise Exception("eeweather cache was not properly primed. Aborting.")
+    _eeweather_cache_primed = True
 
 
 def save_json_cache(index, thermostat_id, station, cache_path=None):
@@ -67,26 +142,66 @@ def save_json_cache(index, thermostat_id, station, cache_path=None):
         if e.errno != errno.EEXIST:
             raise
 
-    json_cache = {}
-
     sqlite_json_store = KeyValueStore()
-    years = index.groupby(index.year).keys()
-    for year in years:
-        filename = "ISD-{station}-{year}.json".format(
-                station=station,
-                year=year)
-        json_cache[filename] = sqlite_json_store.retrieve_json(filename)
+    years = np.unique(index.year)
+    filenames = [
+        "ISD-{station}-{year}.json".format(station=station, year=year)
+        for year in years]
+    json_cache = _retrieve_json_many(sqlite_json_store, filenames)
 
     thermostat_filename = "{thermostat_id}.json".format(thermostat_id=thermostat_id)
     thermostat_path = os.path.join(directory, thermostat_filename)
     try:
-        with open(thermostat_path, 'w') as outfile:
-            json.dump(json_cache, outfile)
+        if orjson is not None:
+            with open(thermostat_path, 'wb', buffering=JSON_CACHE_BUFFER_SIZE) as outfile:
+                outfile.write(orjson.dumps(json_cache))
+        else:
+            with open(thermostat_path, 'w', buffering=JSON_CACHE_BUFFER_SIZE) as outfile:
+                json.dump(json_cache, outfile, separators=(',', ':'))
 
     except Exception as e:
         warnings.warn("Unable to write JSON file: {}".format(e))
 
 
+def _retrieve_json_many(sqlite_json_store, keys):
+    """ Retrieves several JSON values from an eeweather KeyValueStore with a
+    single query, rather than one `retrieve_json` query per key.
+
+    Parameters
+    ----------
+    sqlite_json_store : eeweather.cache.KeyValueStore
+        Store to read from.
+    keys : list of str
+        Keys to retrieve.
+
+    Returns
+    -------
+    json_cache : dict
+        Maps each key to its decoded JSON value (None if the key is missing),
+        in the order of `keys`.
+    """
+    # KeyValueStore keeps its rows in an `items` table of key/data/updated
+    # columns. eeweather 0.3.20 (the pinned version) binds the table's
+    # metadata to the engine; later versions keep the engine on `eng`.
+    items = getattr(sqlite_json_store, "items", None)
+    engine = getattr(sqlite_json_store, "eng", None)
+    if engine is None and items is not None:
+        engine = getattr(items.metadata, "bind", None)
+    if engine is None:
+        return {key: sqlite_json_store.retrieve_json(key) for key in keys}
+
+    # items.select() and attribute access on rows work the same way from
+    # SQLAlchemy 1.3 to 2.0.
+    query = items.select().where(items.c.key.in_(keys))
+    with engine.connect() as connection:
+        found = {row.key: row.data for row in connection.execute(query)}
+
+    return {
+        key: json.loads(found[key]) if key in found else None
+        for key in keys
+    }
+
+
 def normalize_utc_offset(utc_offset):
     """
     Normalizes the UTC offset
@@ -103,9 +218,17 @@ def normalize_utc_offset(utc_offset):
     """
     try:
         if int(utc_offset) == 0:
-            utc_offset = "+0"
-        delta = dateutil.parser.parse(
-            "2000-01-01T00:00:00" + str(utc_offset)).tzinfo.utcoffset(None)
+            return datetime.timedelta(0)
+
+        match = UTC_OFFSET_PATTERN.match(str(utc_offset).strip())
+        if match is None:
+            raise ValueError("expected a signed offset like -7 or -0700")
+        sign, hours, long_hours, minutes = match.groups()
+        delta = datetime.timedelta(
+            hours=int(hours or long_hours),
+            minutes=int(minutes or 0))
+        if sign == "-":
+            delta = -delta
         return delta
 
     except (ValueError, TypeError, AttributeError) as e:
@@ -128,13 +251,18 @@ def from_csv(metadata_filename, verbose=False, save_cache=False, shuffle=True, c
         Set to True to save the cached data to a json file (based on Thermostat ID).
     shuffle: boolean
         Shuffles the thermostats to give them random ordering if desired (helps with caching).
+        If True, thermostats are also returned in the order they finish
+        importing; otherwise they are returned in metadata order.
     cache_path: str
         Directory path to save the cached data
 
     Returns
     -------
     thermostats : iterator over thermostat.Thermostat objects
-        Thermostats imported from the given CSV input files.
+        Thermostats imported from the given CSV input files. Thermostats are
+        imported as the iterator is consumed, at most
+        `MAX_THERMOSTATS_IN_FLIGHT` ahead of it; any that could not be loaded
+        are logged once it is exhausted.
     """
 
     if quiet:
@@ -142,7 +270,7 @@ def from_csv(metadata_filename, verbose=False, save_cache=False, shuffle=True, c
 
     __prime_eeweather_cache()
 
-    metadata = pd.read_csv(
+    metadata = _read_csv(
         metadata_filename,
         dtype={
             "thermostat_id": str,
@@ -158,23 +286,61 @@ def from_csv(metadata_filename, verbose=False, save_cache=False, shuffle=True, c
         logging.info("Metadata randomized to prevent collisions in cache.")
         metadata = metadata.sample(frac=1).reset_index(drop=True)
 
-    p = Pool(AVAILABLE_PROCESSES)
-    multiprocess_func_partial = partial(
-            multiprocess_func,
-            metadata_filename=metadata_filename,
+    # Thermostats are handed out as they are imported rather than collected
+    # into a list first, so apart from the IDs kept for logging the missing
+    # thermostats, memory use doesn't grow with the number of thermostats.
+    return _import_thermostats(
+            metadata,
+            metadata_filename,
             verbose=verbose,
             save_cache=save_cache,
-            cache_path=cache_path)
-    result_list = p.imap(multiprocess_func_partial, metadata.iterrows())
-    p.close()
-    p.join()
+            cache_path=cache_path,
+            ordered=not shuffle)
+
+
+def _import_thermostats(metadata, metadata_filename, verbose=False, save_cache=False, cache_path=None,
+                        ordered=True):
+    """ Generator over the thermostats imported for each row of the metadata,
+    in metadata order if `ordered` is True. Once all rows have been
+    processed, logs the thermostats that could not be loaded.
+
+    Besides the loaded thermostat IDs, at most `MAX_THERMOSTATS_IN_FLIGHT`
+    thermostats are held at a time (see `_import_thermostats_pipelined`)."""
+    loaded_thermostat_ids = set()
+
+    if len(metadata) <= 1:
+        # Starting the worker pools costs more than importing a single
+        # thermostat, so do it in this process.
+        multiprocess_func_partial = partial(
+                multiprocess_func,
+                metadata_filename=metadata_filename,
+                verbose=verbose,
+                save_cache=save_cache,
+                cache_path=cache_path)
+        thermostats = map(multiprocess_func_partial, _iter_metadata_rows(metadata))
+    else:
+        thermostats = _import_thermostats_pipelined(
+                metadata,
+                metadata_filename,
+                verbose=verbose,
+                save_cache=save_cache,
+                cache_path=cache_path,
+                ordered=ordered)
 
-    # Bad thermostats return None so remove those.
-    results = [x for x in result_list if x is not None]
+    try:
+        for thermostat in thermostats:
+            # Bad thermostats return None so skip those.
+            if thermostat is not None:
+                loaded_thermostat_ids.add(thermostat.thermostat_id)
+                yield thermostat
+    finally:
+        # If the caller stops early, shut the worker pools down now rather
+        # than whenever the pipelined generator is garbage collected.
+        if inspect.isgenerator(thermostats):
+            thermostats.close()
 
     # Check for thermostats that were not loaded and log them
     metadata_thermostat_ids = set(metadata.thermostat_id)
-    loaded_thermostat_ids = set([x.thermostat_id for x in results])
     missing_thermostats = metadata_thermostat_ids.difference(loaded_thermostat_ids)
     missing_thermostats_num = len(missing_thermostats)
     if missing_thermostats_num > 0:
@@ -184,37 +350,205 @@ def from_csv(metadata_filename, verbose=False, save_cache=False, shuffle=True, c
         for thermostat in missing_thermostats:
             logging.warning(thermostat)
 
-    # Convert this to an iterator to maintain compatibility
-    return iter(results)
+
+def _import_thermostats_pipelined(metadata, metadata_filename, verbose=False, save_cache=False, cache_path=None,
+                                  ordered=True):
+    """ Imports the thermostats in two stages. The interval data files are
+    read on every core, then the outdoor temperatures are fetched in a pool
+    capped at the FTP connection limit, since each eeweather process keeps
+    its own FTP connection open. Each interval data file is read once.
+
+    The interval data stays in this process until its outdoor temperatures
+    arrive, so only a few values are sent to the weather pool per thermostat.
+    Large tasks can leave `Pool.terminate` waiting forever on a pipe that
+    the terminated workers no longer read.
+
+    At most `MAX_THERMOSTATS_IN_FLIGHT` rows are handed to the first stage
+    before the caller has taken their thermostats (or they were skipped),
+    so memory use doesn't grow with the number of thermostats when the
+    weather stage or the caller falls behind.
+    """
+    interval_data_by_row = {}
+    in_flight = threading.Semaphore(MAX_THERMOSTATS_IN_FLIGHT)
+    stopping = threading.Event()
+
+    def metadata_rows():
+        # Consumed by the load pool's task handler thread, which blocks here
+        # once too many rows are in flight.
+        rows = _iter_metadata_rows(metadata)
+        while True:
+            in_flight.acquire()
+            metadata_row = next(rows, None)
+            if metadata_row is None or stopping.is_set():
+                return
+            yield metadata_row
+
+    def weather_tasks(loaded):
+        for thermostat_data in loaded:
+            # Bad thermostats return None so skip those.
+            if thermostat_data is None:
+                in_flight.release()
+                continue
+            i, row, interval_data = thermostat_data
+            interval_data_by_row[i] = row, interval_data
+            hourly_index = interval_data["hourly_index"]
+            yield (i, row, interval_data["station"], hourly_index[0],
+                   len(hourly_index), interval_data["utc_offset"])
+
+    # Unless the caller needs metadata order, let results come back as they
+    # finish.
+    imap = "imap" if ordered else "imap_unordered"
+    load_pool = Pool(NUMBER_OF_CORES)
+    try:
+        weather_pool = Pool(AVAILABLE_PROCESSES)
+        try:
+            # Rows are handed out one at a time: a chunk would wait for
+            # rows that can't be started until others finish.
+            loaded = getattr(load_pool, imap)(
+                    partial(load_interval_data_func,
+                            metadata_filename=metadata_filename,
+                            verbose=verbose),
+                    metadata_rows())
+            outdoor_temperatures = getattr(weather_pool, imap)(
+                    partial(outdoor_temperatures_func,
+                            save_cache=save_cache,
+                            cache_path=cache_path),
+                    weather_tasks(loaded))
+            for i, temperature_out in outdoor_temperatures:
+                row, interval_data = interval_data_by_row.pop(i)
+                in_flight.release()
+                if temperature_out is not None:
+                    yield _skip_on_error(row, create_thermostat, interval_data, temperature_out)
+        except BaseException:
+            # Includes the caller abandoning the generator early; don't wait
+            # for the remaining thermostats to be imported. Stop handing out
+            # rows first, so the task handlers can finish.
+            stopping.set()
+            in_flight.release()
+            weather_pool.terminate()
+            raise
+        else:
+            weather_pool.close()
+        finally:
+            weather_pool.join()
+    except BaseException:
+        load_pool.terminate()
+        raise
+    else:
+        load_pool.close()
+    finally:
+        load_pool.join()
+
+
+def _iter_metadata_rows(metadata):
+    """ Yields (index, ThermostatMetadata) pairs for each row of the metadata
+    DataFrame, without building a pandas Series per row."""
+    rows = metadata[list(ThermostatMetadata._fields)].itertuples(index=True, name=None)
+    for row in rows:
+        yield row[0], ThermostatMetadata._make(row[1:])
 
 
 def multiprocess_func(metadata, metadata_filename, verbose=False, save_cache=False, cache_path=None):
     """ This function is a partial function for multiproccessing and shares the same arguments as from_csv.
     It is not intended to be called directly."""
     i, row = metadata
+    interval_data_filename = _get_interval_data_filename(row, metadata_filename, verbose)
+    if interval_data_filename is None:
+        return
+
+    return _skip_on_error(
+            row,
+            get_single_thermostat,
+            row.thermostat_id,
+            row.zipcode,
+            row.equipment_type,
+            row.utc_offset,
+            interval_data_filename,
+            save_cache=save_cache,
+            cache_path=cache_path,
+    )
+
+
+def load_interval_data_func(metadata, metadata_filename, verbose=False):
+    """ First stage of the multiprocess import: loads the interval data for
+    a single thermostat (see `load_interval_data`). It is not intended to be
+    called directly.
+
+    Returns
+    -------
+    thermostat_data : tuple or None
+        The (index, ThermostatMetadata, interval data) triple, or None if
+        the thermostat was skipped.
+    """
+    i, row = metadata
+    interval_data_filename = _get_interval_data_filename(row, metadata_filename, verbose)
+    if interval_data_filename is None:
+        return
+
+    interval_data = _skip_on_error(
+            row,
+            load_interval_data,
+            row.thermostat_id,
+            row.zipcode,
+            row.equipment_type,
+            row.utc_offset,
+            interval_data_filename,
+    )
+    if interval_data is None:
+        return
+    return i, row, interval_data
+
+
+def outdoor_temperatures_func(weather_task, save_cache=False, cache_path=None):
+    """ Second stage of the multiprocess import: fetches the outdoor
+    temperatures for a single thermostat (see `get_outdoor_temperatures`).
+    `weather_task` is an (index, ThermostatMetadata, station, start, periods,
+    utc_offset) tuple describing its hourly index. It is not intended to be
+    called directly.
+
+    Returns
+    -------
+    outdoor_temperatures : tuple
+        The (index, temperature_out) pair. `temperature_out` is None if the
+        thermostat was skipped.
+    """
+    i, row, station, start, periods, utc_offset = weather_task
+    hourly_index = pd.date_range(start=start, periods=periods, freq="H")
+    temperature_out = _skip_on_error(
+            row,
+            get_outdoor_temperatures,
+            row.thermostat_id,
+            station,
+            hourly_index,
+            utc_offset,
+            save_cache=save_cache,
+            cache_path=cache_path,
+    )
+    return i, temperature_out
+
+
+def _get_interval_data_filename(row, metadata_filename, verbose):
+    """ Logs the import of a thermostat and returns the path to its interval
+    data, or None (with a warning) if its equipment type is not supported."""
     logger.info("Importing thermostat {}".format(row.thermostat_id))
     if verbose and logger.getEffectiveLevel() > logging.INFO:
         print("Importing thermostat {}".format(row.thermostat_id))
 
     # make sure this thermostat type is supported.
-    if row.equipment_type not in [1, 2, 3, 4, 5]:
+    if row.equipment_type not in SUPPORTED_EQUIPMENT_TYPES:
         warnings.warn(
             "Skipping import of thermostat controlling equipment"
             " of unsupported type. (id={})".format(row.thermostat_id))
         return
 
-    interval_data_filename = os.path.join(os.path.dirname(metadata_filename), row.interval_data_filename)
+    return os.path.join(os.path.dirname(metadata_filename), row.interval_data_filename)
 
+
+def _skip_on_error(row, func, *args, **kwargs):
+    """ Returns `func(*args, **kwargs)`, or None (with a warning) if importing
+    the thermostat in `row` fails."""
     try:
-        thermostat = get_single_thermostat(
-                row.thermostat_id,
-                row.zipcode,
-                row.equipment_type,
-                row.utc_offset,
-                interval_data_filename,
-                save_cache=save_cache,
-                cache_path=cache_path,
-        )
+        return func(*args, **kwargs)
     except ValueError as e:
         # Could not locate a station for the thermostat. Warn and skip.
         warnings.warn(
@@ -242,8 +576,6 @@ def multiprocess_func(metadata, metadata_filename, verbose=False, save_cache=Fal
             .format(row.thermostat_id, e))
         return
 
-    return thermostat
-
 
 def get_single_thermostat(thermostat_id, zipcode, equipment_type,
                           utc_offset, interval_data_filename, save_cache=False, cache_path=None):
@@ -259,9 +591,7 @@ def get_single_thermostat(thermostat_id, zipcode, equipment_type,
         The equipment type of the thermostat.
     utc_offset : str
         A string representing the UTC offset of the interval data, e.g. `"-0700"`.
-        Could also be `"Z"` (UTC), or just `"+7"` (equivalent to `"+0700"`),
-        or any other timezone format recognized by the library
-        method dateutil.parser.parse.
+        Could also be `"0"` (UTC), or just `"+7"` (equivalent to `"+0700"`).
     interval_data_filename : str
         The path to the CSV in which the interval data is stored.
     save_cache: boolean
@@ -274,90 +604,238 @@ def get_single_thermostat(thermostat_id, zipcode, equipment_type,
     thermostat : thermostat.Thermostat
         The loaded thermostat object.
     """
-    df = pd.read_csv(interval_data_filename)
+    interval_data = load_interval_data(
+            thermostat_id, zipcode, equipment_type, utc_offset,
+            interval_data_filename)
+    temperature_out = get_outdoor_temperatures(
+            thermostat_id,
+            interval_data["station"],
+            interval_data["hourly_index"],
+            interval_data["utc_offset"],
+            save_cache=save_cache,
+            cache_path=cache_path)
+    return create_thermostat(interval_data, temperature_out)
+
+
+def load_interval_data(thermostat_id, zipcode, equipment_type,
+                       utc_offset, interval_data_filename):
+    """ Loads everything needed for a thermostat except the outdoor
+    temperatures (see `get_outdoor_temperatures`). The arguments are as in
+    `get_single_thermostat`.
+
+    Returns
+    -------
+    interval_data : dict
+        The `Thermostat` arguments other than `temperature_out`, plus the
+        `hourly_index` and the normalized `utc_offset` to fetch the outdoor
+        temperatures for.
+    """
+    df = _read_csv(interval_data_filename, dtype={"date": str})
 
     heating, cooling, aux_emerg = _get_equipment_type(equipment_type)
 
     # load indices
-    dates = pd.to_datetime(df["date"])
+    dates = _parse_dates(df["date"])
     daily_index = pd.date_range(start=dates[0], periods=dates.shape[0], freq="D")
-    hourly_index = pd.date_range(start=dates[0], periods=dates.shape[0] * 24, freq="H")
-    hourly_index_utc = pd.date_range(start=dates[0], periods=dates.shape[0] * 24, freq="H", tz=pytz.UTC)
+    hourly_index = _get_hourly_index(dates)
 
     # raise an error if dates are not aligned
-    if not all(dates == daily_index):
+    if not np.array_equal(dates.values, daily_index.values):
         message = ("Dates provided for thermostat_id={} may contain some "
                    "which are out of order, missing, or duplicated.".format(thermostat_id))
         raise RuntimeError(message)
 
-    # load hourly time series values
-    temp_in = pd.Series(_get_hourly_block(df, "temp_in"), hourly_index)
+    # load hourly time series values (each block is a new array, so the
+    # Series can use it as-is)
+    temp_in = pd.Series(_get_hourly_block(df, "temp_in"), hourly_index, copy=False)
 
     if heating:
-        heating_setpoint = pd.Series(_get_hourly_block(df, "heating_setpoint"), hourly_index)
+        heating_setpoint = pd.Series(_get_hourly_block(df, "heating_setpoint"), hourly_index, copy=False)
     else:
         heating_setpoint = None
 
     if cooling:
-        cooling_setpoint = pd.Series(_get_hourly_block(df, "cooling_setpoint"), hourly_index)
+        cooling_setpoint = pd.Series(_get_hourly_block(df, "cooling_setpoint"), hourly_index, copy=False)
     else:
         cooling_setpoint = None
 
     if aux_emerg:
-        auxiliary_heat_runtime = pd.Series(_get_hourly_block(df, "auxiliary_heat_runtime"), hourly_index)
-        emergency_heat_runtime = pd.Series(_get_hourly_block(df, "emergency_heat_runtime"), hourly_index)
+        auxiliary_heat_runtime = pd.Series(_get_hourly_block(df, "auxiliary_heat_runtime"), hourly_index, copy=False)
+        emergency_heat_runtime = pd.Series(_get_hourly_block(df, "emergency_heat_runtime"), hourly_index, copy=False)
     else:
         auxiliary_heat_runtime = None
         emergency_heat_runtime = None
 
-    # load outdoor temperatures
-    station = get_closest_station_by_zipcode(zipcode)
-
+    # find the source of outdoor temperatures
+    station = _get_closest_station_by_zipcode(zipcode)
     if station is None:
         message = "Could not locate a valid source of outdoor temperature " \
                 "data for ZIP code {}".format(zipcode)
         raise RuntimeError(message)
 
     utc_offset = normalize_utc_offset(utc_offset)
-    temp_out = get_indexed_temperatures_eeweather(station, hourly_index_utc - utc_offset)
-    temp_out.index = hourly_index
-
-    # Export the data from the cache
-    if save_cache:
-        save_json_cache(hourly_index, thermostat_id, station, cache_path)
 
     # load daily time series values
     if cooling:
-        cool_runtime = pd.Series(df["cool_runtime"].values, daily_index)
+        cool_runtime = pd.Series(df["cool_runtime"].values, daily_index, copy=False)
     else:
         cool_runtime = None
     if heating:
-        heat_runtime = pd.Series(df["heat_runtime"].values, daily_index)
+        heat_runtime = pd.Series(df["heat_runtime"].values, daily_index, copy=False)
     else:
         heat_runtime = None
 
-    # create thermostat instance
-    thermostat = Thermostat(
-        thermostat_id,
-        equipment_type,
-        zipcode,
-        station,
-        temp_in,
-        temp_out,
-        cooling_setpoint,
-        heating_setpoint,
-        cool_runtime,
-        heat_runtime,
-        auxiliary_heat_runtime,
-        emergency_heat_runtime
-    )
-    return thermostat
+    return {
+        "thermostat_id": thermostat_id,
+        "equipment_type": equipment_type,
+        "zipcode": zipcode,
+        "station": station,
+        "temperature_in": temp_in,
+        "cooling_setpoint": cooling_setpoint,
+        "heating_setpoint": heating_setpoint,
+        "cool_runtime": cool_runtime,
+        "heat_runtime": heat_runtime,
+        "auxiliary_heat_runtime": auxiliary_heat_runtime,
+        "emergency_heat_runtime": emergency_heat_runtime,
+        "hourly_index": hourly_index,
+        "utc_offset": utc_offset,
+    }
+
+
+def get_outdoor_temperatures(thermostat_id, station, hourly_index, utc_offset,
+                             save_cache=False, cache_path=None):
+    """ Fetches the outdoor temperatures for a thermostat.
+
+    Parameters
+    ----------
+    thermostat_id : str
+        A unique identifier for the thermostat.
+    station : str
+        Weather station to use for outdoor temperatures.
+    hourly_index : pd.DatetimeIndex
+        Hourly index of the interval data.
+    utc_offset : datetime.timedelta
+        UTC offset of the interval data (see `normalize_utc_offset`).
+    save_cache: boolean
+        Set to True to save the cached data to a json file (based on Thermostat ID).
+    cache_path: str
+        Directory path to save the cached data
+
+    Returns
+    -------
+    temperature_out : pd.Series
+        Outdoor temperatures over `hourly_index`.
+    """
+    temp_out = get_indexed_temperatures_eeweather(station, _get_hourly_index_utc(hourly_index, utc_offset))
+    temp_out.index = hourly_index
+
+    # Export the data from the cache
+    if save_cache:
+        save_json_cache(hourly_index, thermostat_id, station, cache_path)
+
+    return temp_out
+
+
+def create_thermostat(interval_data, temperature_out):
+    """ Creates a thermostat from the output of `load_interval_data` and
+    `get_outdoor_temperatures`.
+
+    Returns
+    -------
+    thermostat : thermostat.Thermostat
+        The loaded thermostat object.
+    """
+    thermostat_kwargs = dict(interval_data)
+    del thermostat_kwargs["hourly_index"]
+    del thermostat_kwargs["utc_offset"]
+    return Thermostat(temperature_out=temperature_out, **thermostat_kwargs)
+
+
+def _read_csv(filename, dtype=None):
+    """ Reads a CSV file into a DataFrame. Uses the (much faster) pyarrow CSV
+    parser if pyarrow is installed, otherwise falls back to `pd.read_csv`.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the CSV file.
+    dtype : dict
+        Maps column names to `str` or `int`.
+
+    Returns
+    -------
+    df : pd.DataFrame
+        Columns not listed in `dtype` get the same dtypes as `pd.read_csv`
+        would give them (e.g. ISO dates are not converted).
+    """
+    if pyarrow_csv is None:
+        return pd.read_csv(filename, dtype=dtype)
+
+    column_types = {
+        column: PYARROW_TYPES[column_type]
+        for column, column_type in (dtype or {}).items()
+    }
+    convert_options = pyarrow_csv.ConvertOptions(
+        column_types=column_types,
+        strings_can_be_null=True)
+    table = pyarrow_csv.read_csv(filename, convert_options=convert_options)
+
+    # Columns that are empty throughout the file are read as pyarrow's null
+    # type, which to_pandas turns into object columns of None. Make them
+    # float64 NaN columns, as pd.read_csv does.
+    for i, field in enumerate(table.schema):
+        if pyarrow.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pyarrow.float64()))
+    return table.to_pandas()
+
+
+def _parse_dates(dates):
+    """ Parses the interval data date column, which is read as strings (with
+    or without pyarrow). Dates in the documented YYYY-MM-DD format take
+    pandas' fast path; anything else falls back to format inference."""
+    try:
+        return pd.to_datetime(dates, format=DATE_FORMAT, cache=True)
+    except ValueError:
+        return pd.to_datetime(dates, cache=True)
+
+
+def _get_hourly_index(dates):
+    """ Returns the (local, timezone-naive) hourly index covering the given
+    daily dates from the interval data file."""
+    return pd.date_range(start=dates[0], periods=dates.shape[0] * 24, freq="H")
+
+
+def _get_hourly_index_utc(hourly_index, utc_offset):
+    """ Converts the local hourly index to UTC.
+
+    Parameters
+    ----------
+    hourly_index : pd.DatetimeIndex
+        Timezone-naive hourly index (see `_get_hourly_index`).
+    utc_offset : datetime.timedelta
+        UTC offset of the interval data (see `normalize_utc_offset`).
+
+    Returns
+    -------
+    hourly_index_utc : pd.DatetimeIndex
+    """
+    # Localizing to UTC only attaches the timezone; no second date_range.
+    return hourly_index.tz_localize("UTC") - utc_offset
 
 
 def _get_hourly_block(df, prefix):
-    columns = ["{}_{:02d}".format(prefix, i) for i in range(24)]
-    values = df[columns].values
-    return values.reshape((values.shape[0] * values.shape[1],))
+    columns = HOURLY_COLUMNS[prefix]
+    # Resolve all 24 labels in one vectorized lookup, then read by position.
+    positions = df.columns.get_indexer(columns)
+    if (positions < 0).any():
+        missing = [column for column, position in zip(columns, positions) if position < 0]
+        raise KeyError("Missing hourly columns: {}".format(missing))
+
+    # Read all 24 columns in one call rather than building a Series per
+    # column; ravel() flattens day by day (hour 00-23 for each day). Like
+    # `df[columns].values`, this copies twice (the column selection, then
+    # the F-ordered array in ravel) and keeps the columns' common dtype.
+    return df.iloc[:, positions].to_numpy().ravel()
 
 
 def _get_equipment_type(equipment_type):
@@ -371,13 +849,4 @@ def _get_equipment_type(equipment_type):
     aux_emerg : boolean
         True if the equipment type has auxiliary/emergency heat equipment
     """
-    # heating, cooling, aux_emerg
-    equipment_type_dict = {
-        1: (True, True, True),
-        2: (True, True, False),
-        3: (True, True, False),
-        4: (True, False, False),
-        5: (False, True, False),
-        }
-
-    return(equipment_type_dict.get(equipment_type, None))
+    return(EQUIPMENT_TYPES.get(equipment_type, None))